@@ -0,0 +1,34 @@
+#include "adv_fstrings.h"
+const char * Player_species = "Human";
+void Player____init__(struct Player * self, int64_t hp)
+{
+    (void)self;
+    (void)hp;
+    char __fbuf[256];
+    (void)__fbuf;
+    self->hp = hp;
+    self->name = "Hero";
+}
+const char * Player__get_name(struct Player * self)
+{
+    (void)self;
+    char __fbuf[256];
+    (void)__fbuf;
+    return self->name;
+}
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t x = 5;
+    pb_print_str((snprintf(__fbuf, 256, "Simple fstring: x=%lld", x), __fbuf));
+    pb_print_str((snprintf(__fbuf, 256, "%lld", (x + 1)), __fbuf));
+    pb_print_str((snprintf(__fbuf, 256, "Float conversion: %s", pb_format_double((double)(2))), __fbuf));
+    pb_print_str("--------------------------------");
+    struct Player __tmp_player_1;
+    Player____init__(&__tmp_player_1, 100);
+    struct Player * p = &__tmp_player_1;
+    pb_print_str((snprintf(__fbuf, 256, "player.hp: %lld", p->hp), __fbuf));
+    pb_print_str((snprintf(__fbuf, 256, "player get_name: %s", Player__get_name(p)), __fbuf));
+    pb_print_str((snprintf(__fbuf, 256, "Player.species: %s", Player_species), __fbuf));
+}
\ No newline at end of file
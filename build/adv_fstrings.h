@@ -0,0 +1,9 @@
+#pragma once
+#include "pb_runtime.h"
+typedef struct Player {
+    const char * species;
+    int64_t hp;
+    const char * name;
+} Player;
+void Player____init__(struct Player * self, int64_t hp);
+const char * Player__get_name(struct Player * self);
\ No newline at end of file
@@ -0,0 +1,38 @@
+#include "arr_rw.h"
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t __tmp_list_1[] = {0};
+    List_int a = (List_int){ .len=1, .data=__tmp_list_1 };
+    list_int_set(&a, 0, 10);
+    int64_t x = list_int_get(&a, 0);
+    list_int_print(&a);
+    pb_print_int(x);
+    List_int __tmp_list_2;
+    list_int_init(&__tmp_list_2);
+    List_int b = __tmp_list_2;
+    PbTryContext __exc_ctx_1;
+    pb_push_try(&__exc_ctx_1);
+    int __exc_flag_1 = setjmp(__exc_ctx_1.env);
+    bool __exc_handled_1 = false;
+    if (__exc_flag_1 == 0) {
+        list_int_set(&b, 0, 1);
+    pb_pop_try();
+    } else {
+        if (strcmp(pb_current_exc.type, "IndexError") == 0) {
+            pb_print_str("IndexError");
+            list_int_append(&b, 1);
+            pb_clear_exc();
+            __exc_handled_1 = true;
+        }
+        else {
+            pb_reraise();
+        }
+    }
+    if (__exc_flag_1 && !__exc_handled_1) pb_reraise();
+    int64_t y = list_int_get(&b, 0);
+    list_int_print(&b);
+    pb_print_int(y);
+    pb_print_str((snprintf(__fbuf, 256, "LEN(a): %lld", a.len), __fbuf));
+}
\ No newline at end of file
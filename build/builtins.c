@@ -0,0 +1,41 @@
+#include "builtins.h"
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t x = 10;
+    double y = 1.0;
+    double z = 0.0;
+    const char * a = "1";
+    const char * b = "1.0";
+    double x_float = (double)(x);
+    pb_print_str((snprintf(__fbuf, 256, "x: %lld, x_float: %s", x, pb_format_double(x_float)), __fbuf));
+    double b_float = (strtod)(b, NULL);
+    pb_print_str((snprintf(__fbuf, 256, "b: '%s', b_float: %s", b, pb_format_double(b_float)), __fbuf));
+    int64_t y_int = (int64_t)(y);
+    pb_print_str((snprintf(__fbuf, 256, "y: %s, y_int: %lld", pb_format_double(y), y_int), __fbuf));
+    int64_t a_int = (strtoll)(a, NULL, 10);
+    pb_print_str((snprintf(__fbuf, 256, "a: '%s', a_int: %lld", a, a_int), __fbuf));
+    bool x_bool = (x != 0);
+    pb_print_str((snprintf(__fbuf, 256, "x: %lld, x_bool: %s", x, ((x_bool) ? "True" : "False")), __fbuf));
+    bool y_bool = (y != 0.0);
+    pb_print_str((snprintf(__fbuf, 256, "y: %s, y_bool: %s", pb_format_double(y), ((y_bool) ? "True" : "False")), __fbuf));
+    bool z_bool = (z != 0.0);
+    pb_print_str((snprintf(__fbuf, 256, "z: %s, z_bool: %s", pb_format_double(z), ((z_bool) ? "True" : "False")), __fbuf));
+    int64_t __tmp_list_1[] = {1, 2, 3};
+    List_int arr = (List_int){ .len=3, .data=__tmp_list_1 };
+    list_int_set(&arr, 0, (int64_t)(4.5));
+    list_int_print(&arr);
+    const char * __tmp_list_2[] = {"1", "2", "3"};
+    List_str arr2 = (List_str){ .len=3, .data=__tmp_list_2 };
+    list_str_set(&arr2, 0, pb_format_int(4));
+    list_str_print(&arr2);
+    double __tmp_list_3[] = {1.1, 2.2, 3.3};
+    List_float arr3 = (List_float){ .len=3, .data=__tmp_list_3 };
+    list_float_set(&arr3, 0, (double)(4));
+    list_float_print(&arr3);
+    bool __tmp_list_4[] = {true, false};
+    List_bool arr4 = (List_bool){ .len=2, .data=__tmp_list_4 };
+    list_bool_set(&arr4, 0, (1 != 0));
+    list_bool_print(&arr4);
+}
\ No newline at end of file
@@ -0,0 +1,2 @@
+#pragma once
+#include "pb_runtime.h"
\ No newline at end of file
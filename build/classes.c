@@ -0,0 +1,101 @@
+#include "classes.h"
+struct Empty __tmp_empty_1;
+struct Empty * e;
+struct ClassWithUserDefinedAttr __tmp_classwithuserdefinedattr_2;
+struct ClassWithUserDefinedAttr * uda;
+struct Empty __tmp_empty_3;
+struct Empty * ClassWithUserDefinedAttr_uda;
+const char * Player_name = "P";
+int64_t Player_BASE_HP = 150;
+int64_t Mage_DEFAULT_MANA = 200;
+__attribute__((constructor)) static void classes__init_globals(void)
+{
+    Empty____init__(&__tmp_empty_1);
+    e = &__tmp_empty_1;
+    ClassWithUserDefinedAttr____init__(&__tmp_classwithuserdefinedattr_2);
+    uda = &__tmp_classwithuserdefinedattr_2;
+    Empty____init__(&__tmp_empty_3);
+    ClassWithUserDefinedAttr_uda = &__tmp_empty_3;
+}
+void Empty____init__(struct Empty * self) { /* no-op */ }
+void ClassWithUserDefinedAttr____init__(struct ClassWithUserDefinedAttr * self) { /* no-op */ }
+void Player____init__(struct Player * self)
+{
+    (void)self;
+    char __fbuf[256];
+    (void)__fbuf;
+    self->hp = 150;
+}
+int64_t Player__get_hp(struct Player * self)
+{
+    (void)self;
+    char __fbuf[256];
+    (void)__fbuf;
+    return self->hp;
+}
+int64_t Player__default_hp(struct Player * self)
+{
+    (void)self;
+    char __fbuf[256];
+    (void)__fbuf;
+    return Player_BASE_HP;
+}
+void Mage____init__(struct Mage * self)
+{
+    (void)self;
+    char __fbuf[256];
+    (void)__fbuf;
+    Player____init__((struct Player *)self);
+    self->mana = 200;
+}
+int64_t Mage__total_power(struct Mage * self, int64_t bonus)
+{
+    (void)self;
+    (void)bonus;
+    char __fbuf[256];
+    (void)__fbuf;
+    return ((self->base.hp + self->mana) + bonus);
+}
+static inline int64_t Mage__default_hp(
+    struct Mage * self) {
+    return Player__default_hp((struct Player *)self);
+}
+static inline int64_t Mage__get_hp(
+    struct Mage * self) {
+    return Player__get_hp((struct Player *)self);
+}
+void ArchMage____init__(struct ArchMage * self) {
+    Mage____init__((struct Mage *)self);
+}
+static inline int64_t ArchMage__total_power(
+    struct ArchMage * self, int64_t bonus) {
+    return Mage__total_power((struct Mage *)self, bonus);
+}
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    struct Player __tmp_player_4;
+    Player____init__(&__tmp_player_4);
+    struct Player * p = &__tmp_player_4;
+    pb_print_int(p->hp);
+    pb_print_int(Player__get_hp(p));
+    pb_print_str(Player_name);
+    pb_print_int(Player_BASE_HP);
+    pb_print_str(Player_name);
+    struct Mage __tmp_mage_5;
+    Mage____init__(&__tmp_mage_5);
+    struct Mage * m = &__tmp_mage_5;
+    pb_print_int(m->base.hp);
+    pb_print_int(m->mana);
+    pb_print_int(Mage__get_hp(m));
+    pb_print_str(Player_name);
+    pb_print_str(Player_name);
+    pb_print_int(Mage_DEFAULT_MANA);
+    struct ArchMage __tmp_archmage_6;
+    ArchMage____init__(&__tmp_archmage_6);
+    struct ArchMage * a = &__tmp_archmage_6;
+    pb_print_int(a->base.mana);
+    pb_print_int(a->base.base.hp);
+    pb_print_int(ArchMage__total_power(a, 10));
+}
\ No newline at end of file
@@ -0,0 +1,30 @@
+#pragma once
+#include "pb_runtime.h"
+extern struct Empty * e;
+extern struct ClassWithUserDefinedAttr * uda;
+typedef struct Empty {
+} Empty;
+typedef struct ClassWithUserDefinedAttr {
+    struct Empty * uda;
+} ClassWithUserDefinedAttr;
+typedef struct Player {
+    const char * name;
+    int64_t BASE_HP;
+    int64_t hp;
+} Player;
+typedef struct Mage {
+    Player base;
+    int64_t DEFAULT_MANA;
+    int64_t mana;
+} Mage;
+typedef struct ArchMage {
+    Mage base;
+} ArchMage;
+void Empty____init__(struct Empty * self);
+void ClassWithUserDefinedAttr____init__(struct ClassWithUserDefinedAttr * self);
+void Player____init__(struct Player * self);
+int64_t Player__get_hp(struct Player * self);
+int64_t Player__default_hp(struct Player * self);
+void Mage____init__(struct Mage * self);
+int64_t Mage__total_power(struct Mage * self, int64_t bonus);
+void ArchMage____init__(struct ArchMage * self);
\ No newline at end of file
@@ -0,0 +1,18 @@
+#include "default_args.h"
+int64_t default_args_increment(int64_t x, int64_t step)
+{
+    (void)x;
+    (void)step;
+    char __fbuf[256];
+    (void)__fbuf;
+    return (x + step);
+}
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t a = default_args_increment(5, 1);
+    int64_t b = default_args_increment(5, 3);
+    pb_print_int(a);
+    pb_print_int(b);
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+#pragma once
+#include "pb_runtime.h"
+int64_t default_args_increment(int64_t x, int64_t step);
\ No newline at end of file
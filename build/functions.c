@@ -0,0 +1,35 @@
+#include "functions.h"
+void functions_print_int(int64_t x)
+{
+    (void)x;
+    char __fbuf[256];
+    (void)__fbuf;
+    pb_print_int(x);
+}
+int64_t functions_add(int64_t x, int64_t y)
+{
+    (void)x;
+    (void)y;
+    char __fbuf[256];
+    (void)__fbuf;
+    return (x + y);
+}
+void functions_add_in_place(int64_t x, int64_t y)
+{
+    (void)x;
+    (void)y;
+    char __fbuf[256];
+    (void)__fbuf;
+    x += y;
+    functions_print_int(x);
+}
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t x = 10;
+    int64_t y = 20;
+    int64_t z = functions_add(x, y);
+    functions_print_int(z);
+    functions_add_in_place(x, y);
+}
\ No newline at end of file
@@ -0,0 +1,5 @@
+#pragma once
+#include "pb_runtime.h"
+void functions_print_int(int64_t x);
+int64_t functions_add(int64_t x, int64_t y);
+void functions_add_in_place(int64_t x, int64_t y);
\ No newline at end of file
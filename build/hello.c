@@ -0,0 +1,8 @@
+#include "hello.h"
+const char * hello = "Hello World";
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    pb_print_str(hello);
+}
\ No newline at end of file
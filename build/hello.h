@@ -0,0 +1,3 @@
+#pragma once
+#include "pb_runtime.h"
+extern const char * hello;
\ No newline at end of file
@@ -0,0 +1,46 @@
+#include "list_indexing.h"
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t __tmp_list_1[] = {100};
+    List_int arr_int = (List_int){ .len=1, .data=__tmp_list_1 };
+    pb_print_int(list_int_get(&arr_int, 0));
+    list_int_set(&arr_int, 0, 1);
+    int64_t x = list_int_get(&arr_int, 0);
+    pb_print_int(x);
+    pb_print_int(list_int_get(&arr_int, 0));
+    list_int_print(&arr_int);
+    const char * __tmp_list_2[] = {"a", "b"};
+    List_str arr_str = (List_str){ .len=2, .data=__tmp_list_2 };
+    pb_print_str(list_str_get(&arr_str, 0));
+    list_str_set(&arr_str, 0, "C");
+    list_str_set(&arr_str, 1, "C");
+    PbTryContext __exc_ctx_1;
+    pb_push_try(&__exc_ctx_1);
+    int __exc_flag_1 = setjmp(__exc_ctx_1.env);
+    bool __exc_handled_1 = false;
+    if (__exc_flag_1 == 0) {
+        list_str_set(&arr_str, 2, "C");
+    pb_pop_try();
+    } else {
+        if (strcmp(pb_current_exc.type, "IndexError") == 0) {
+            pb_print_str((snprintf(__fbuf, 256, "Caught Index Error for list element with index 2", 0), __fbuf));
+            pb_clear_exc();
+            __exc_handled_1 = true;
+        }
+        else {
+            pb_reraise();
+        }
+    }
+    if (__exc_flag_1 && !__exc_handled_1) pb_reraise();
+    pb_print_str(list_str_get(&arr_str, 0));
+    list_str_print(&arr_str);
+    bool __tmp_list_3[] = {true};
+    List_bool arr_bool = (List_bool){ .len=1, .data=__tmp_list_3 };
+    list_bool_set(&arr_bool, 0, false);
+    list_bool_print(&arr_bool);
+    const char * __tmp_list_4[] = {"some string", "word", "L"};
+    List_str arr_str2 = (List_str){ .len=3, .data=__tmp_list_4 };
+    list_str_print(&arr_str2);
+}
\ No newline at end of file
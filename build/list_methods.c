@@ -0,0 +1,24 @@
+#include "list_methods.h"
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    int64_t __tmp_list_1[] = {1, 2};
+    List_int nums = (List_int){ .len=2, .data=__tmp_list_1 };
+    list_int_append(&nums, 3);
+    list_int_print(&nums);
+    int64_t last = list_int_pop(&nums);
+    pb_print_int(last);
+    list_int_print(&nums);
+    list_int_append(&nums, 4);
+    list_int_remove(&nums, 1);
+    list_int_print(&nums);
+    List_str __tmp_list_2;
+    list_str_init(&__tmp_list_2);
+    List_str words = __tmp_list_2;
+    list_str_append(&words, "a");
+    pb_print_str(list_str_pop(&words));
+    list_str_append(&words, "b");
+    list_str_remove(&words, "b");
+    list_str_print(&words);
+}
\ No newline at end of file
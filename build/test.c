@@ -0,0 +1,9 @@
+#include "test.h"
+int64_t x = 1;
+int main(void)
+{
+    char __fbuf[256];
+    (void)__fbuf;
+    pb_print_str((snprintf(__fbuf, 256, "%s", pb_format_double((x * 2.0))), __fbuf));
+    pb_print_str((snprintf(__fbuf, 256, "%lld", (x * false)), __fbuf));
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+#pragma once
+#include "pb_runtime.h"
+extern int64_t x;
\ No newline at end of file
@@ -63,6 +63,39 @@ class CodeGen:
 
     INDENT = "    "
 
+    # Constant lookup tables, built once at class creation rather than per call
+    _C_TYPES = {
+        "int": "int64_t",
+        "float": "double",
+        "bool": "bool",
+        "str": "const char *",
+        "file": "PbFile",
+        # containers with a prebuilt runtime implementation
+        'list[int]': 'List_int',
+        'list[float]': 'List_float',
+        'list[bool]': 'List_bool',
+        'list[str]': 'List_str',
+        'set[int]': 'Set_int',
+        'set[float]': 'Set_float',
+        'set[bool]': 'Set_bool',
+        'set[str]': 'Set_str',
+        'dict[str, int]': 'Dict_str_int',
+        'dict[str, float]': 'Dict_str_float',
+        'dict[str, bool]': 'Dict_str_bool',
+        'dict[str, str]': 'Dict_str_str',
+    }
+    _FSTRING_SPECS = {
+        "int": "%lld",
+        "str": "%s",
+        "bool": "%s"
+    }
+    _LIST_GET_FUNCS = {
+        'int': 'list_int_get',
+        'float': 'list_float_get',
+        'bool': 'list_bool_get',
+        'str': 'list_str_get',
+    }
+
     def __init__(self) -> None:
         self._lines: List[str] = []
         self._indent: int = 0
@@ -239,6 +272,10 @@ class CodeGen:
 
     def _emit(self, line: str = "") -> None:
         prefix = self.INDENT * self._indent
+        # Line breaks are never printable, so most lines skip splitlines()
+        if line and line.isprintable():
+            self._lines.append(f"{prefix}{line}")
+            return
         for sub in line.splitlines():
             self._lines.append(f"{prefix}{sub}")
 
@@ -302,52 +339,22 @@ class CodeGen:
                 pb_type = parts[0]
             else:
                 raise NotImplementedError(f"C codegen does not support union type '{pb_type}'")
-        tbl = {
-            "int": "int64_t",
-            "float": "double",
-            "bool": "bool",
-            "str": "const char *",
-            "file": "PbFile",
-        }
-        if pb_type in tbl:
-            return tbl[pb_type]
+        c_type = self._C_TYPES.get(pb_type)
+        if c_type is not None:
+            return c_type
         if pb_type.startswith("list[") and pb_type.endswith("]"):
-            mapping = {
-                'list[int]': 'List_int',
-                'list[float]': 'List_float',
-                'list[bool]': 'List_bool',
-                'list[str]': 'List_str',
-            }
-            if pb_type in mapping:
-                return mapping[pb_type]
             elem = pb_type[5:-1].strip()
             c_elem = self._c_type(elem)
             name = self._sanitize(elem)
             self._needed_list_types.add((name, c_elem))
             return f"List_{name}"
         if pb_type.startswith("set[") and pb_type.endswith("]"):
-            mapping = {
-                'set[int]': 'Set_int',
-                'set[float]': 'Set_float',
-                'set[bool]': 'Set_bool',
-                'set[str]': 'Set_str',
-            }
-            if pb_type in mapping:
-                return mapping[pb_type]
             elem = pb_type[4:-1].strip()
             c_elem = self._c_type(elem)
             name = self._sanitize(elem)
             self._needed_set_types.add((name, c_elem))
             return f"Set_{name}"
         if pb_type.startswith("dict[str,") and pb_type.endswith("]"):
-            mapping = {
-                'dict[str, int]': 'Dict_str_int',
-                'dict[str, float]': 'Dict_str_float',
-                'dict[str, bool]': 'Dict_str_bool',
-                'dict[str, str]': 'Dict_str_str',
-            }
-            if pb_type in mapping:
-                return mapping[pb_type]
             val = pb_type[len("dict[str,"):-1].strip()
             c_val = self._c_type(val)
             name = self._sanitize(val)
@@ -977,11 +984,7 @@ class CodeGen:
         fmt_parts = []
         args = []
 
-        specs = {
-            "int": "%lld",
-            "str": "%s",
-            "bool": "%s"
-        }
+        specs = self._FSTRING_SPECS
 
         for part in e.parts:
             if isinstance(part, FStringText):
@@ -1301,12 +1304,7 @@ class CodeGen:
         t = self._get_expr_type(e)
         if t and t.startswith("list[") and t.endswith("]"):
             etype = e.elem_type or t[5:-1]
-            func = {
-                'int': 'list_int_get',
-                'float': 'list_float_get',
-                'bool': 'list_bool_get',
-                'str': 'list_str_get',
-            }.get(etype)
+            func = self._LIST_GET_FUNCS.get(etype)
             if func:
                 return f"{func}(&{base}, {idx})"
             return f"{base}.data[{idx}]"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import ast
+import sys
 from enum import Enum, auto
 from typing import List, NamedTuple
 
@@ -165,7 +166,17 @@ TOKEN_REGEX = [
     (re.compile(r'[A-Za-z_][A-Za-z0-9_]*'), TokenType.IDENTIFIER),
 ]
 
+# All rules folded into one alternation: branches are tried left to right,
+# so the first rule that matches wins exactly as in TOKEN_REGEX order, but
+# the whole search runs inside the regex engine. Group ``T<i>`` is rule i.
+MASTER_TOKEN_REGEX = re.compile("|".join(
+    f"(?P<T{i}>{regex.pattern})" for i, (regex, _) in enumerate(TOKEN_REGEX)
+))
+_GROUP_TOKEN_TYPES = {f"T{i}": ttype for i, (_, ttype) in enumerate(TOKEN_REGEX)}
+
 WHITESPACE = re.compile(r'[ \t]*')
+# characters that start/end a string, escape, or open a comment
+_COMMENT_SPECIAL = re.compile(r'[\\"\'#]')
 
 def split_comment(line: str) -> tuple[str, str | None, int | None]:
     """Return code portion and comment from a line.
@@ -175,31 +186,32 @@ def split_comment(line: str) -> tuple[str, str | None, int | None]:
     the comment starts. If no comment is present, returns the line and ``None``
     values.
     """
-    result = []
+    if "#" not in line:
+        return line, None, None
+
+    # Jump straight between the characters that can change state instead of
+    # classifying every character of the line in Python
     in_string = False
     string_char = ''
-    escape = False
-    for idx, c in enumerate(line):
-        if escape:
-            result.append(c)
-            escape = False
-        elif c == '\\':
-            result.append(c)
-            escape = True
-        elif in_string:
-            result.append(c)
+    pos = 0
+    while True:
+        m = _COMMENT_SPECIAL.search(line, pos)
+        if m is None:
+            return line, None, None
+        idx = m.start()
+        c = line[idx]
+        if c == '\\':
+            pos = idx + 2  # skip the escaped character
+            continue
+        if in_string:
             if c == string_char:
                 in_string = False
+        elif c == '#':
+            return line[:idx], line[idx:], idx + 1
         else:
-            if c in ('"', "'"):
-                in_string = True
-                string_char = c
-                result.append(c)
-            elif c == '#':
-                return ''.join(result), line[idx:], idx + 1
-            else:
-                result.append(c)
-    return ''.join(result), None, None
+            in_string = True
+            string_char = c
+        pos = idx + 1
 
 
 # ───────────────────────── lexer proper ─────────────────────────
@@ -272,16 +284,16 @@ class Lexer:
                     pos = self._scan_fstring(line, pos)
                     continue
 
-            for regex, ttype in TOKEN_REGEX:
-                m = regex.match(line, pos)
-                if not m:
-                    continue
-
+            m = MASTER_TOKEN_REGEX.match(line, pos)
+            if m:
+                ttype = _GROUP_TOKEN_TYPES[m.lastgroup]
                 text, value = m.group(0), m.group(0)
 
-                # promote keywords
-                if ttype == TokenType.IDENTIFIER and value in KEYWORDS:
-                    ttype = KEYWORDS[value]
+                # promote keywords; names are interned so later dict lookups
+                # and comparisons against them hit the identity fast path
+                if ttype == TokenType.IDENTIFIER:
+                    value = sys.intern(value)
+                    ttype = KEYWORDS.get(value, ttype)
 
                 # numeric literals – strip underscores
                 elif ttype in (TokenType.INT_LIT, TokenType.FLOAT_LIT):
@@ -300,7 +312,6 @@ class Lexer:
                     if self.bracket_depth > 0:
                         self.bracket_depth -= 1
                 pos = m.end()
-                break
             else:
                 snippet = line[pos:pos + 10]
                 raise LexerError(f"Unknown token {snippet!r}", self.line_num, pos + 1)
@@ -326,15 +337,16 @@ class Lexer:
                 pos += 1
                 continue
 
-            for regex, ttype in TOKEN_REGEX:
-                m = regex.match(expr, pos)
-                if not m:
-                    continue
+            m = MASTER_TOKEN_REGEX.match(expr, pos)
+            if m:
+                ttype = _GROUP_TOKEN_TYPES[m.lastgroup]
                 text = m.group(0)
                 value = text
-                # promote keywords
-                if ttype == TokenType.IDENTIFIER and value in KEYWORDS:
-                    ttype = KEYWORDS[value]
+                # promote keywords; names are interned so later dict lookups
+                # and comparisons against them hit the identity fast path
+                if ttype == TokenType.IDENTIFIER:
+                    value = sys.intern(value)
+                    ttype = KEYWORDS.get(value, ttype)
                 elif ttype in (TokenType.INT_LIT, TokenType.FLOAT_LIT):
                     value = value.replace("_", "")
                 elif ttype == TokenType.STRING_LIT:
@@ -347,7 +359,6 @@ class Lexer:
                 elif ttype in (TokenType.RPAREN, TokenType.RBRACKET, TokenType.RBRACE):
                     if self.bracket_depth > 0:
                         self.bracket_depth -= 1
-                break
             else:
                 snippet = expr[pos:pos + 10]
                 raise LexerError(f"Unknown token in f-string expression: {snippet!r}", base_line, base_col + pos + 1)
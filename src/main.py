@@ -2,6 +2,7 @@ import os
 import subprocess
 import argparse
 import shutil
+import tempfile
 from pprint import pprint
 
 from lexer import Lexer, LexerError
@@ -88,12 +89,9 @@ def build(source_code: str, pb_path: str, output_file: str, verbose: bool = Fals
     runtime_header = get_build_output_path("pb_runtime.h")
     runtime_lib = get_build_output_path("pb_runtime.a")
 
-    # -- Disabled while still prototyping
-    # Check if runtime library exists
-    # if not os.path.isfile(runtime_lib):
-        # if verbose: print("Runtime library not found; building it now...")
-        # build_runtime_library(verbose=verbose, debug=debug)    
-    build_runtime_library(verbose=verbose, debug=debug)    
+    if runtime_library_is_stale():
+        if verbose: print("Runtime library missing or out of date; building it now...")
+        build_runtime_library(verbose=verbose, debug=debug)
 
     include_dirs, lib_dirs, link_flags = collect_vendor_build_info(loaded_modules)
 
@@ -181,10 +179,33 @@ def write_module_code_files(mod_symbol, build_dir, verbose: bool = False, debug:
     return c_path  # return path for later GCC command
 
 
+def runtime_library_is_stale() -> bool:
+    """
+    Return True if build/pb_runtime.a or build/pb_runtime.h is missing or
+    older than the runtime sources in src/.
+    """
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    src_c = os.path.join(this_dir, "pb_runtime.c")
+    src_h = os.path.join(this_dir, "pb_runtime.h")
+    try:
+        lib_mtime = os.path.getmtime(get_build_output_path("pb_runtime.a"))
+        # The header is copied with copy2, so it keeps the mtime of src_h
+        header_mtime = os.path.getmtime(get_build_output_path("pb_runtime.h"))
+        return (
+            lib_mtime < max(os.path.getmtime(src_c), os.path.getmtime(src_h))
+            or header_mtime < os.path.getmtime(src_h)
+        )
+    except OSError:
+        return True
+
+
 def build_runtime_library(verbose: bool = False, debug: bool = False):
     """
     Builds the PB runtime into a static library (pb_runtime.a)
     and copies the header to the build directory.
+
+    Outputs are built under temporary names and renamed into place, so a
+    concurrent gcc never links against a half-written archive.
     """
     this_dir = os.path.dirname(os.path.abspath(__file__))
     root_dir = os.path.abspath(os.path.join(this_dir, ".."))
@@ -202,30 +223,35 @@ def build_runtime_library(verbose: bool = False, debug: bool = False):
 
     # Compile to object file
     obj_path = os.path.join(build_dir, "pb_runtime.o")
-    compile_cmd = ["gcc", "-std=c99", "-c", src_c, "-o", obj_path]
-    if verbose: print("PB Runtime compile command:", " ".join(compile_cmd))
+    with tempfile.TemporaryDirectory(dir=build_dir) as tmp_dir:
+        tmp_obj = os.path.join(tmp_dir, "pb_runtime.o")
+        tmp_lib = os.path.join(tmp_dir, "pb_runtime.a")
+        tmp_header = os.path.join(tmp_dir, "pb_runtime.h")
+        compile_cmd = ["gcc", "-std=c99", "-c", src_c, "-o", tmp_obj]
+        if verbose: print("PB Runtime compile command:", " ".join(compile_cmd))
+
+        result = subprocess.run(compile_cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"Compilation failed:\n{result.stderr}")
+            return
 
-    result = subprocess.run(compile_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Compilation failed:\n{result.stderr}")
-        return
+        # Archive into static library
+        # lib_path = os.path.join(build_dir, "libpbruntime.a")
+        ar_cmd = ["ar", "rcs", tmp_lib, tmp_obj]
+        if verbose: print("Archive command:", " ".join(ar_cmd))
 
-    # Archive into static library
-    # lib_path = os.path.join(build_dir, "libpbruntime.a")
-    ar_cmd = ["ar", "rcs", lib_path, obj_path]
-    if verbose: print("Archive command:", " ".join(ar_cmd))
+        result = subprocess.run(ar_cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"Archiving failed:\n{result.stderr}")
+            return
 
-    result = subprocess.run(ar_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Archiving failed:\n{result.stderr}")
-        return
+        shutil.copy2(src_h, tmp_header)
+        os.replace(tmp_obj, obj_path)
+        os.replace(tmp_lib, lib_path)
+        os.replace(tmp_header, header_dest)
 
     if verbose:
         print(f"Built static library: {lib_path}")
-
-    # Copy header
-    shutil.copy2(src_h, header_dest)
-    if verbose:
         print(f"Copied pb_runtime.h to: {header_dest}")
 
 
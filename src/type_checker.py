@@ -76,8 +76,9 @@ Testing:
 """
 
 
+from functools import lru_cache
 from ntpath import expanduser
-from typing import Dict, Tuple, Optional, List, Set
+from typing import Callable, Dict, Tuple, Optional, List, Set
 
 from lang_ast import (
     ForStmt,
@@ -140,6 +141,7 @@ def promote_numeric_types(left: str, right: str) -> str:
     right_index = PROMOTION_ORDER.index(right)
     return PROMOTION_ORDER[max(left_index, right_index)]
 
+@lru_cache(maxsize=None)
 def types_match(actual: str, expected: str) -> bool:
     """Return True if ``actual`` is compatible with ``expected`` including simple
     unions using ``|`` with ``None``."""
@@ -151,6 +153,23 @@ def types_match(actual: str, expected: str) -> bool:
         return all(types_match(p, expected) for p in parts)
     return actual == expected
 
+@lru_cache(maxsize=None)
+def literal_type(raw: str) -> str:
+    """Return the PB type of a literal from its raw source text.
+
+    Depends on nothing but ``raw``, so results are shared across all checks.
+    """
+    if raw == "True" or raw == "False":
+        return "bool"
+    elif raw == "None":
+        return "None"
+    elif raw.startswith('"') or raw.startswith("'"):
+        return "str"
+    elif "." in raw or "e" in raw or "E" in raw:
+        return "float"
+    else:
+        return "int"
+
 def is_assignable(from_type: str, to_type: str) -> bool:
     """
     Returns True if a value of from_type can be assigned to a variable of to_type.
@@ -288,49 +307,17 @@ class TypeChecker:
 
     def check_stmt(self, stmt: Stmt, parent: Stmt | None = None):
         """Type-check a single statement."""
-        if isinstance(stmt, VarDecl):
-            self.check_var_decl(stmt)
-        elif isinstance(stmt, AssignStmt):
-            self.check_assign_stmt(stmt)
-        elif isinstance(stmt, AugAssignStmt):
-            self.check_aug_assign_stmt(stmt)
-        elif isinstance(stmt, ClassDef):
-            self.check_class_def(stmt)
-        elif isinstance(stmt, FunctionDef):
-            self.check_function_def(stmt)
-        elif isinstance(stmt, ReturnStmt):
-            self.check_return_stmt(stmt, parent)
-        elif isinstance(stmt, IfStmt):
-            self.check_if_stmt(stmt)
-        elif isinstance(stmt, WhileStmt):
-            self.check_while_stmt(stmt)
-        elif isinstance(stmt, ForStmt):
-            self.check_for_stmt(stmt)
-        elif isinstance(stmt, AssertStmt):
-            self.check_assert_stmt(stmt)
-        elif isinstance(stmt, RaiseStmt):
-            self.check_raise_stmt(stmt)
-        elif isinstance(stmt, GlobalStmt):
-            self.check_global_stmt(stmt)
-        elif isinstance(stmt, TryExceptStmt):
-            self.check_try_except_stmt(stmt)
-        elif isinstance(stmt, PassStmt):
-            pass  # nothing to check
-        elif isinstance(stmt, (ImportStmt, ImportFromStmt)):
-            pass  # handled by main orchestrator
-        elif isinstance(stmt, BreakStmt):
-            if self.in_loop == 0:
-                raise TypeError("'break' outside of loop")
-
-        elif isinstance(stmt, ContinueStmt):
-            if self.in_loop == 0:
-                raise TypeError("'continue' outside of loop")
-
-        elif isinstance(stmt, ExprStmt):
-            stmt.inferred_type = self.check_expr(stmt.expr)  # validate call, access, etc.
-
-        else:
+        handler = self._STMT_HANDLERS.get(type(stmt))
+        if handler is None:
             raise NotImplementedError(f"Type checking not yet implemented for {type(stmt).__name__}")
+        handler(self, stmt, parent)
+
+    def _check_loop_control(self, keyword: str):
+        if self.in_loop == 0:
+            raise TypeError(f"'{keyword}' outside of loop")
+
+    def _check_expr_stmt(self, stmt: ExprStmt, parent: Stmt | None = None):
+        stmt.inferred_type = self.check_expr(stmt.expr)  # validate call, access, etc.
 
     def check_var_decl(self, decl: VarDecl):
         """Type-check a variable declaration.
@@ -423,22 +410,8 @@ class TypeChecker:
             TypeError if the expression is invalid in structure or type.
         """
         if isinstance(expr, Literal):
-            raw = expr.raw
-            if raw == "True" or raw == "False":
-                expr.inferred_type = "bool"
-                return "bool"
-            elif raw == "None":
-                expr.inferred_type = "None"
-                return "None"
-            elif raw.startswith('"') or raw.startswith("'"):
-                expr.inferred_type = "str"
-                return "str"
-            elif "." in raw or "e" in raw or "E" in raw:
-                expr.inferred_type = "float"
-                return "float"
-            else:
-                expr.inferred_type = "int"
-                return "int"
+            expr.inferred_type = literal_type(expr.raw)
+            return expr.inferred_type
 
         elif isinstance(expr, StringLiteral):
             expr.inferred_type = "str"
@@ -1490,6 +1463,34 @@ class TypeChecker:
             for s in stmt.finally_body:
                 self.check_stmt(s)
 
+    def _ignore_stmt(self, stmt: Stmt, parent: Stmt | None = None):
+        pass
+
+    # Statement node type → handler(self, stmt, parent), shared by all checkers.
+    # AST node classes are never subclassed, so an exact type lookup replaces
+    # the isinstance chain.
+    _STMT_HANDLERS: Dict[type, Callable[..., None]] = {
+        VarDecl: lambda self, stmt, parent: self.check_var_decl(stmt),
+        AssignStmt: lambda self, stmt, parent: self.check_assign_stmt(stmt),
+        AugAssignStmt: lambda self, stmt, parent: self.check_aug_assign_stmt(stmt),
+        ClassDef: lambda self, stmt, parent: self.check_class_def(stmt),
+        FunctionDef: lambda self, stmt, parent: self.check_function_def(stmt),
+        ReturnStmt: check_return_stmt,
+        IfStmt: lambda self, stmt, parent: self.check_if_stmt(stmt),
+        WhileStmt: lambda self, stmt, parent: self.check_while_stmt(stmt),
+        ForStmt: lambda self, stmt, parent: self.check_for_stmt(stmt),
+        AssertStmt: lambda self, stmt, parent: self.check_assert_stmt(stmt),
+        RaiseStmt: lambda self, stmt, parent: self.check_raise_stmt(stmt),
+        GlobalStmt: lambda self, stmt, parent: self.check_global_stmt(stmt),
+        TryExceptStmt: lambda self, stmt, parent: self.check_try_except_stmt(stmt),
+        PassStmt: _ignore_stmt,  # nothing to check
+        ImportStmt: _ignore_stmt,  # handled by main orchestrator
+        ImportFromStmt: _ignore_stmt,
+        BreakStmt: lambda self, stmt, parent: self._check_loop_control("break"),
+        ContinueStmt: lambda self, stmt, parent: self._check_loop_control("continue"),
+        ExprStmt: _check_expr_stmt,
+    }
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) < 3:
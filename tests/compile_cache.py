@@ -0,0 +1,114 @@
+"""
+On-disk cache for compiler output produced while running the tests.
+
+Entries are keyed on the inputs *and* on a fingerprint of the compiler
+sources in `src/`, so editing the lexer, parser, type checker or codegen
+invalidates every cached result. Entries live in a per-fingerprint
+subdirectory of `build/test_cache`; directories left behind by older
+fingerprints are removed the first time a process uses the cache.
+
+Only use it for results that depend on nothing but the key parts: programs
+without imports, or callers that add `library_fingerprint()` (stdlib/ and
+vendor/) and every imported module's source to the key.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+from module_loader import get_std_vendor_paths
+from tests import root_dir, build_dir
+
+CACHE_ROOT = os.path.join(build_dir, "test_cache")
+SRC_DIR = os.path.join(root_dir, "src")
+
+
+def _hash_tree(h, top: str) -> None:
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            h.update(os.path.relpath(path, top).encode())
+            with open(path, "rb") as f:
+                h.update(f.read())
+
+
+@functools.cache
+def compiler_fingerprint() -> str:
+    """Digest of every compiler source file; computed once per process."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(os.listdir(SRC_DIR)):
+        if name.endswith((".py", ".c", ".h")):
+            h.update(name.encode())
+            with open(os.path.join(SRC_DIR, name), "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+@functools.cache
+def library_fingerprint() -> str:
+    """Digest of every file under stdlib/ and vendor/, which imports resolve against."""
+    h = hashlib.blake2b(digest_size=16)
+    for top in get_std_vendor_paths():
+        h.update(os.path.basename(top).encode())
+        _hash_tree(h, top)
+    return h.hexdigest()
+
+
+@functools.cache
+def cache_dir() -> str:
+    """Entry directory for the current compiler; prunes ones from older compilers."""
+    current = compiler_fingerprint()
+    if os.path.isdir(CACHE_ROOT):
+        for name in os.listdir(CACHE_ROOT):
+            stale = os.path.join(CACHE_ROOT, name)
+            if name == current:
+                continue
+            if os.path.isdir(stale):
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+    path = os.path.join(CACHE_ROOT, current)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_key(*parts: str) -> str:
+    h = hashlib.blake2b(compiler_fingerprint().encode(), digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load(key: str):
+    """Return the cached value for `key`, or None on a miss."""
+    try:
+        with open(os.path.join(cache_dir(), f"{key}.pickle"), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def store(key: str, value) -> None:
+    directory = cache_dir()
+    # Write to a temp file first so concurrent readers never see partial data
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, os.path.join(directory, f"{key}.pickle"))
+
+
+def cached(compute, *parts: str):
+    """Return the cached result for `parts`, calling `compute()` on a miss."""
+    key = cache_key(*parts)
+    value = load(key)
+    if value is None:
+        value = compute()
+        store(key, value)
+    return value
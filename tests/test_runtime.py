@@ -1,41 +1,98 @@
+import contextlib
+import functools
 import unittest
 import subprocess
 import tempfile
 import sys
 import os
+import shlex
 import shutil
 import ast
 
-from type_checker import TypeError
-from lexer import Lexer
-from parser import Parser
-from codegen import CodeGen
-from type_checker import TypeChecker
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from pb_pipeline import compile_code_to_c_and_h
-from main import build_runtime_library
+from main import build_runtime_library, runtime_library_is_stale
 from main import get_build_output_path
-from tests import build_dir
+from tests import compile_cache
+
+
+RUNTIME_LIB = get_build_output_path("pb_runtime.a")
+RUNTIME_HEADER = get_build_output_path("pb_runtime.h")
+EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+# Cached test binaries kept per compiler version; least recently used go first
+EXE_CACHE_MAX_ENTRIES = 256
+# Compiler for test binaries; CC="ccache gcc" puts a compiler cache in front
+CC = shlex.split(os.environ.get("CC", "gcc"))
+# Test binaries only need to be correct: skip optimization, temp files and the
+# unwind/stack-protector/ident extras that only add backend work
+GCC_FLAGS = [
+    "-std=c99", "-W", "-O0", "-pipe",
+    "-fno-stack-protector", "-fno-asynchronous-unwind-tables", "-fno-unwind-tables", "-fno-ident",
+]
+
+
+def _decode(data: bytes) -> str:
+    """Decode process output once, with the newline translation text mode would do."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def setUpModule():
+    """Build the runtime library once, before any test in this module runs."""
+    if not runtime_library_is_stale():
+        return
+    # Serialize the build across parallel test workers
+    with open(get_build_output_path("pb_runtime.lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if runtime_library_is_stale():
+            build_runtime_library(verbose=False, debug=False)
 
 
-def _compile_and_run_modules(modules: dict[str, str]) -> str:
+@functools.cache
+def _cc_version() -> str:
+    result = subprocess.run([*CC, "--version"], capture_output=True, text=True)
+    return result.stdout
+
+
+def _cached_exe_path(modules: dict[str, str]) -> str:
+    """Cache location of the executable built from `modules`.
+
+    The key covers every module's name and source, the C compiler version and flags,
+    everything under stdlib/ and vendor/ (imports resolve there first), and (via
+    `compile_cache`) the compiler and runtime sources.
     """
-    Compiles and runs PB code from multiple in-memory modules.
+    parts = [_cc_version(), *GCC_FLAGS, compile_cache.library_fingerprint()]
+    for name, code in modules.items():
+        parts += [name, code]
+    return os.path.join(compile_cache.cache_dir(), "exe", compile_cache.cache_key(*parts) + EXE_SUFFIX)
+
+
+def _build_modules(modules: dict[str, str], exe_path: str) -> None:
+    """
+    Compiles PB code from multiple in-memory modules into `exe_path`.
     Writes each to disk to support real module imports.
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         c_files = []
 
         # Step 1: Write all .pb files
+        pb_files: dict[str, str] = {}
         for name, code in modules.items():
-            pb_rel = f"{name.replace('.', os.sep)}.pb"
-            pb_file = os.path.join(tmpdir, pb_rel)
+            pb_file = os.path.join(tmpdir, f"{name.replace('.', os.sep)}.pb")
             os.makedirs(os.path.dirname(pb_file), exist_ok=True)
             with open(pb_file, "w", encoding="utf-8") as f:
                 f.write(code)
+            pb_files[name] = pb_file
 
         # Step 2: Compile each module using real pb_path
-        for name in modules:
-            pb_file = os.path.join(tmpdir, f"{name.replace('.', os.sep)}.pb")
+        for name, pb_file in pb_files.items():
             h_code, c_code, ast, _ = compile_code_to_c_and_h(
                 source_code=modules[name],
                 module_name=name,
@@ -56,35 +113,70 @@ def _compile_and_run_modules(modules: dict[str, str]) -> str:
 
             c_files.append(c_path)
 
-        exe_path = os.path.join(tmpdir, "main")
-        if sys.platform == "win32":
-            exe_path += ".exe"
-
-        runtime_lib = get_build_output_path("pb_runtime.a")
-        runtime_header = get_build_output_path("pb_runtime.h")
-        if not os.path.isfile(runtime_lib) or not os.path.isfile(runtime_header):
-            build_runtime_library(verbose=False, debug=False)
         # Copy the runtime header next to generated sources to avoid picking up
         # unrelated headers that may exist in the system include paths on some
         # platforms (e.g. Windows)
-        shutil.copy2(runtime_header, os.path.join(tmpdir, "pb_runtime.h"))
+        shutil.copy2(RUNTIME_HEADER, os.path.join(tmpdir, "pb_runtime.h"))
 
+        # Link into the cache dir under a temp name, then rename into place so
+        # a concurrent reader never runs a half-written binary
+        os.makedirs(os.path.dirname(exe_path), exist_ok=True)
+        fd, tmp_exe = tempfile.mkstemp(dir=os.path.dirname(exe_path), suffix=EXE_SUFFIX)
+        os.close(fd)
         compile_cmd = [
-            "gcc", "-std=c99", "-W",
+            *CC, *GCC_FLAGS,
             *c_files,
-            "-o", exe_path,
+            "-o", tmp_exe,
             "-I", tmpdir,
             "-I", get_build_output_path(""),
-            runtime_lib
+            RUNTIME_LIB
         ]
 
-        result = subprocess.run(compile_cmd, capture_output=True, text=True)
+        # gcc is silent on success, so stderr is only decoded when the build fails
+        result = subprocess.run(compile_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         if result.returncode != 0:
-            raise RuntimeError(f"GCC build failed:\n{result.stderr}")
+            # gcc deletes its -o target itself when linking fails
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_exe)
+            raise RuntimeError(f"GCC build failed:\n{_decode(result.stderr)}")
+        os.replace(tmp_exe, exe_path)
+    _prune_exe_cache(os.path.dirname(exe_path))
+
+
+def _prune_exe_cache(directory: str) -> None:
+    """Drop the least recently used executables beyond `EXE_CACHE_MAX_ENTRIES`."""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:  # removed by a concurrent worker
+                pass
+    if len(entries) <= EXE_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:-EXE_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
-        run_result = subprocess.run([exe_path], capture_output=True, text=True)
-        return (run_result.stdout + run_result.stderr).strip()
 
+def _compile_and_run_modules(modules: dict[str, str]) -> str:
+    """
+    Compiles and runs PB code from multiple in-memory modules.
+    Executables are cached on disk, so unchanged programs skip straight to the run.
+    """
+    exe_path = _cached_exe_path(modules)
+    if os.path.isfile(exe_path):
+        # Refresh the mtime so pruning sees this binary as recently used
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(exe_path)
+    else:
+        _build_modules(modules, exe_path)
+
+    run_result = subprocess.run([exe_path], capture_output=True)
+    return _decode(run_result.stdout + run_result.stderr).strip()
 
 
 def compile_and_run(code: str) -> str:
@@ -235,8 +327,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.splitlines()
-        self.assertEqual(lines[0], "1")
-        self.assertEqual(lines[1], "42")
+        self.assertEqual(lines[:2], ["1", "42"])
 
     def test_global_float_update_runtime(self):
         code = (
@@ -251,8 +342,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "1.5")
-        self.assertEqual(lines[1], "3.5")
+        self.assertEqual(lines[:2], ["1.5", "3.5"])
 
     def test_chained_comparison_runtime(self):
         code = (
@@ -292,18 +382,18 @@ class TestPipelineRuntime(unittest.TestCase):
         lines = output.strip().splitlines()
 
         # Assertions for arr_int
-        self.assertEqual(lines[0], "100")              # arr_int[0] before assignment
-        self.assertEqual(lines[1], "1")                # arr_int[0] after assignment
-        self.assertEqual(lines[2], "1")                # arr_int[0] after assignment
-        self.assertEqual(lines[3], "[1]")              # arr_int list contents
-
-        # Assertions for arr_str
-        self.assertEqual(lines[4], "a")                # arr_str[0] before assignment
-        self.assertEqual(lines[5], "C")                # arr_str[0] after assignment
-        self.assertEqual(lines[6], "['C', 'C']")           # arr_str list contents
-
-        # Assertions for arr_bool
-        self.assertEqual(lines[7], "[False]")          # arr_bool after assignment
+        self.assertEqual(lines[:8], [
+            "100",  # arr_int[0] before assignment
+            "1",  # arr_int[0] after assignment
+            "1",  # arr_int[0] after assignment
+            "[1]",  # arr_int list contents
+            # Assertions for arr_str
+            "a",  # arr_str[0] before assignment
+            "C",  # arr_str[0] after assignment
+            "['C', 'C']",  # arr_str list contents
+            # Assertions for arr_bool
+            "[False]",  # arr_bool after assignment
+        ])
 
     def test_empty_list_assignment_runtime(self):
         code = (
@@ -322,9 +412,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "[10]")
-        self.assertEqual(lines[1], "10")
-        self.assertEqual(lines[2], "caught")
+        self.assertEqual(lines[:3], ["[10]", "10", "caught"])
 
     def test_list_assignment_out_of_bounds_runtime(self):
         code = (
@@ -341,10 +429,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], 'a')
-        self.assertEqual(lines[1], 'caught')
-        self.assertEqual(lines[2], 'a')
-        self.assertEqual(lines[3], "['a', 'b']")
+        self.assertEqual(lines[:4], ['a', 'caught', 'a', "['a', 'b']"])
 
     def test_set_literal_runtime(self):
         code = (
@@ -415,13 +500,15 @@ class TestPipelineRuntime(unittest.TestCase):
         lines = output.strip().splitlines()
 
         # Assertions for type conversions
-        self.assertEqual(lines[0], "x: 10, x_float: 10.0")  # x to float
-        self.assertEqual(lines[1], "b: 1.0, b_float: 1.0")  # b to float
-        self.assertEqual(lines[2], "y: 1.0, y_int: 1")        # y to int
-        self.assertEqual(lines[3], "a: 1, a_int: 1")        # a to int
-        self.assertEqual(lines[4], "x: 10, x_bool: True")     # x to bool
-        self.assertEqual(lines[5], "y: 1.0, y_bool: True")    # y to bool
-        self.assertEqual(lines[6], "z: 0.0, z_bool: False")    # z to bool
+        self.assertEqual(lines[:7], [
+            "x: 10, x_float: 10.0",  # x to float
+            "b: 1.0, b_float: 1.0",  # b to float
+            "y: 1.0, y_int: 1",  # y to int
+            "a: 1, a_int: 1",  # a to int
+            "x: 10, x_bool: True",  # x to bool
+            "y: 1.0, y_bool: True",  # y to bool
+            "z: 0.0, z_bool: False",  # z to bool
+        ])
 
     def test_list_conversion_functions_runtime(self):
         code = (
@@ -441,10 +528,12 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "[4, 2, 3]")
-        self.assertEqual(lines[1], "['4', '2', '3']")
-        self.assertEqual(lines[2], "[4.0, 2.2, 3.3]")
-        self.assertEqual(lines[3], "[True, False]")
+        self.assertEqual(lines[:4], [
+            "[4, 2, 3]",
+            "['4', '2', '3']",
+            "[4.0, 2.2, 3.3]",
+            "[True, False]",
+        ])
     def test_fstring_expression_variants(self):
         code = (
             "class Player:\n"
@@ -474,13 +563,15 @@ class TestPipelineRuntime(unittest.TestCase):
         lines = output.strip().splitlines()
 
         # Assertions for correctness of f-string interpolation
-        self.assertEqual(lines[0], "Simple fstring: x=5")
-        self.assertEqual(lines[1], "x + 1: 6")
-        self.assertEqual(lines[2], "Float conversion: 2.0")
-        self.assertEqual(lines[3], "--------------------------------")
-        self.assertEqual(lines[4], "player.hp: 100")
-        self.assertEqual(lines[5], "player get_name: Hero")
-        self.assertEqual(lines[6], "Player.species: Human")
+        self.assertEqual(lines[:7], [
+            "Simple fstring: x=5",
+            "x + 1: 6",
+            "Float conversion: 2.0",
+            "--------------------------------",
+            "player.hp: 100",
+            "player get_name: Hero",
+            "Player.species: Human",
+        ])
 
     def test_runtime_exception_is_raised(self):
         code = (
@@ -549,8 +640,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "6")
-        self.assertEqual(lines[1], "8")
+        self.assertEqual(lines[:2], ["6", "8"])
 
     def test_if_name_main_guard_runtime(self):
         code = (
@@ -610,12 +700,7 @@ class TestPipelineRuntime(unittest.TestCase):
         )
         output = compile_and_run(code)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "150")
-        self.assertEqual(lines[1], "150")
-        self.assertEqual(lines[2], "P")
-        self.assertEqual(lines[3], "150")
-        self.assertEqual(lines[4], "200")
-        self.assertEqual(lines[5], "150")
+        self.assertEqual(lines[:6], ["150", "150", "P", "150", "200", "150"])
 
     def test_class_field_without_initializer_runtime(self):
         code = (
@@ -711,9 +796,7 @@ class TestPipelineRuntime(unittest.TestCase):
 
         output = compile_modules_and_run_main(modules)
         lines = output.strip().splitlines()
-        self.assertEqual(lines[0], "9")
-        self.assertEqual(lines[1], "9")
-        self.assertEqual(lines[2], "3.1415")
+        self.assertEqual(lines[:3], ["9", "9", "3.1415"])
 
     def test_from_import_function(self):
         modules = {
@@ -754,9 +837,7 @@ class TestPipelineRuntime(unittest.TestCase):
             code = f.read()
         output = _compile_and_run_modules({"raw_strings": code})
         lines = output.splitlines()
-        self.assertEqual(lines[0], "line\\nnext")
-        self.assertEqual(lines[1], "hello")
-        self.assertEqual(lines[2], "    world")
+        self.assertEqual(lines[:3], ["line\\nnext", "hello", "    world"])
 
     def test_len_builtin_runtime(self):
         code = (
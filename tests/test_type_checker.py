@@ -1,4 +1,3 @@
-from sys import exception
 import unittest
 
 from type_checker import TypeChecker, TypeError, ModuleSymbol
@@ -44,6 +43,52 @@ from lang_ast import (
 )
 
 
+# raw literal text → inferred type
+LITERAL_CASES = [
+    ("123", "int"),
+    ("3.14", "float"),
+    ("6.02e23", "float"),
+    ("True", "bool"),
+    ("False", "bool"),
+    ("None", "None"),
+]
+
+# (left, op, right) on literals → result type
+BINOP_CASES = [
+    ("1", "+", "2", "int"),
+    ("1.0", "+", "2.0", "float"),
+    ("1", "+", "2.0", "float"),
+    ("True", "+", "7", "int"),
+    ("False", "+", "1.0", "float"),
+    ("1", "*", "2.0", "float"),
+    ("1", "*", "False", "int"),
+    ("42", "==", "42", "bool"),
+    ("1", "<", "2", "bool"),
+    ("1", "<=", "2", "bool"),
+    ("2", ">", "1", "bool"),
+    ("2", ">=", "1", "bool"),
+    ("None", "is", "None", "bool"),
+    ("True", "and", "False", "bool"),
+]
+
+BINOP_ERROR_CASES = [
+    ('"hello"', "+", "3"),
+    ("1", "and", "2"),
+]
+
+# (op, operand) on a literal → result type
+UNARY_CASES = [
+    ("-", "42", "int"),
+    ("-", "3.14", "float"),
+    ("not", "False", "bool"),
+]
+
+UNARY_ERROR_CASES = [
+    ("-", "True"),
+    ("not", "1"),
+]
+
+
 
 # ────────────────────────────────────────────────────────────────
 # Unit-level tests (method-level granularity)
@@ -62,29 +107,10 @@ class TestTypeCheckerInternals(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.tc.check_var_decl(decl)
 
-    def test_check_expr_literal_int(self):
-        typ = self.tc.check_expr(Literal(raw="123"))
-        self.assertEqual(typ, "int")
-
-    def test_check_expr_literal_float(self):
-        typ = self.tc.check_expr(Literal(raw="3.14"))
-        self.assertEqual(typ, "float")
-
-    def test_check_expr_literal_scientific(self):
-        typ = self.tc.check_expr(Literal(raw="6.02e23"))
-        self.assertEqual(typ, "float")
-
-    def test_check_expr_literal_bool_true(self):
-        typ = self.tc.check_expr(Literal(raw="True"))
-        self.assertEqual(typ, "bool")
-
-    def test_check_expr_literal_bool_false(self):
-        typ = self.tc.check_expr(Literal(raw="False"))
-        self.assertEqual(typ, "bool")
-
-    def test_check_expr_literal_none(self):
-        typ = self.tc.check_expr(Literal(raw="None"))
-        self.assertEqual(typ, "None")
+    def test_check_expr_literal_types(self):
+        for raw, expected in LITERAL_CASES:
+            with self.subTest(raw=raw):
+                self.assertEqual(self.tc.check_expr(Literal(raw=raw)), expected)
 
     def test_check_expr_identifier_found(self):
         self.tc.env["y"] = "int"
@@ -95,97 +121,32 @@ class TestTypeCheckerInternals(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.tc.check_expr(Identifier(name="z", inferred_type="str"))
 
-    def test_binop_add_ints(self):
-        expr = BinOp(Literal("1"), "+", Literal("2"))
-        self.assertEqual(self.tc.check_expr(expr), "int")
-
-    def test_binop_add_floats(self):
-        expr = BinOp(Literal("1.0"), "+", Literal("2.0"))
-        self.assertEqual(self.tc.check_expr(expr), "float")
-
-    def test_binop_add_int_and_float(self):
-        expr = BinOp(Literal("1"), "+", Literal("2.0"))
-        self.assertEqual(self.tc.check_expr(expr), "float")
+    def test_binop_types(self):
+        for left, op, right, expected in BINOP_CASES:
+            with self.subTest(expr=f"{left} {op} {right}"):
+                expr = BinOp(Literal(left), op, Literal(right))
+                self.assertEqual(self.tc.check_expr(expr), expected)
 
-    def test_binop_add_bool_and_int(self):
-        expr = BinOp(Literal("True"), "+", Literal("7"))
-        self.assertEqual(self.tc.check_expr(expr), "int")
-
-    def test_binop_add_bool_and_float(self):
-        expr = BinOp(Literal("False"), "+", Literal("1.0"))
-        self.assertEqual(self.tc.check_expr(expr), "float")
-
-    def test_binop_mul_int_and_float(self):
-        expr = BinOp(Literal("1"), "*", Literal("2.0"))
-        self.assertEqual(self.tc.check_expr(expr), "float")
-
-    def test_binop_mul_int_and_bool(self):
-        expr = BinOp(Literal("1"), "*", Literal("False"))
-        self.assertEqual(self.tc.check_expr(expr), "int")
-
-    def test_binop_add_incompatible_types_raises(self):
-        expr = BinOp(Literal('"hello"'), "+", Literal("3"))
-        with self.assertRaises(TypeError):
-            self.tc.check_expr(expr)
-
-    def test_binop_eq(self):
-        expr = BinOp(Literal("42"), "==", Literal("42"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_lt(self):
-        expr = BinOp(Literal("1"), "<", Literal("2"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_lte(self):
-        expr = BinOp(Literal("1"), "<=", Literal("2"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_gt(self):
-        expr = BinOp(Literal("2"), ">", Literal("1"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_gte(self):
-        expr = BinOp(Literal("2"), ">=", Literal("1"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
+    def test_binop_invalid_operands_raise(self):
+        for left, op, right in BINOP_ERROR_CASES:
+            with self.subTest(expr=f"{left} {op} {right}"):
+                with self.assertRaises(TypeError):
+                    self.tc.check_expr(BinOp(Literal(left), op, Literal(right)))
 
     def test_chained_comparison_type(self):
         expr = BinOp(BinOp(Literal("1"), "<", Literal("2")), "and", BinOp(Literal("2"), "<", Literal("3")))
         self.assertEqual(self.tc.check_expr(expr), "bool")
 
-    def test_binop_is(self):
-        expr = BinOp(Literal("None"), "is", Literal("None"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_and_bool(self):
-        expr = BinOp(Literal("True"), "and", Literal("False"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_binop_and_nonbool(self):
-        expr = BinOp(Literal("1"), "and", Literal("2"))
-        with self.assertRaises(TypeError):
-            self.tc.check_expr(expr)
-
-    def test_unary_minus_int(self):
-        expr = UnaryOp("-", Literal("42"))
-        self.assertEqual(self.tc.check_expr(expr), "int")
-
-    def test_unary_minus_float(self):
-        expr = UnaryOp("-", Literal("3.14"))
-        self.assertEqual(self.tc.check_expr(expr), "float")
+    def test_unary_types(self):
+        for op, operand, expected in UNARY_CASES:
+            with self.subTest(expr=f"{op} {operand}"):
+                self.assertEqual(self.tc.check_expr(UnaryOp(op, Literal(operand))), expected)
 
-    def test_unary_minus_invalid(self):
-        expr = UnaryOp("-", Literal("True"))
-        with self.assertRaises(TypeError):
-            self.tc.check_expr(expr)
-
-    def test_unary_not_bool(self):
-        expr = UnaryOp("not", Literal("False"))
-        self.assertEqual(self.tc.check_expr(expr), "bool")
-
-    def test_unary_not_invalid(self):
-        expr = UnaryOp("not", Literal("1"))
-        with self.assertRaises(TypeError):
-            self.tc.check_expr(expr)
+    def test_unary_invalid_operand_raises(self):
+        for op, operand in UNARY_ERROR_CASES:
+            with self.subTest(expr=f"{op} {operand}"):
+                with self.assertRaises(TypeError):
+                    self.tc.check_expr(UnaryOp(op, Literal(operand)))
 
     def test_call_expr_valid(self):
         self.tc.functions["inc"] = (["int"], "int", 1)